@@ -6,42 +6,103 @@ Respects ENT_OFFLINE flag to avoid network calls when scraping is disabled.
 
 from __future__ import annotations
 
+import atexit
 from typing import Optional
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from .config import HTTP_TIMEOUT, OFFLINE, USER_AGENT
 
 HEADERS = {"User-Agent": USER_AGENT}
 
+# Candidate containers for the intro paragraph, broad to narrow; defined once
+# so every call hands the same selector string to the lexbor CSS engine.
+_BIO_SELECTOR = (
+    "main p, article p, .field-name-body p, .provider-bio p, .bio p, .pane-node-body p"
+)
+
+# Shared pooled client: profile fetches hit the same few hosts hundreds of
+# times per refresh, so keep-alive amortizes the TCP+TLS handshake cost.
+_CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=HTTP_TIMEOUT,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+)
+atexit.register(_CLIENT.close)
+
+# The intro paragraph sits near the top of the page, so stop reading after
+# this many bytes; bloated faculty pages can run to megabytes of markup.
+_MAX_BIO_BYTES = 256_000
+
+
+def fetch_professor_bio(
+    profile_url: str | None,
+    # Bound at def-time so the hot path reads locals, not module globals.
+    _offline: bool = OFFLINE,
+    _client: httpx.Client = _CLIENT,
+) -> Optional[str]:
+    if _offline or not profile_url:
+        return None
+    try:
+        with _client.stream("GET", profile_url) as resp:
+            resp.raise_for_status()
+            chunks: list[bytes] = []
+            total = 0
+            for chunk in resp.iter_bytes():
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= _MAX_BIO_BYTES:
+                    break
+            encoding = resp.encoding or "utf-8"
+    except Exception:
+        return None
+
+    return extract_bio(b"".join(chunks).decode(encoding, errors="replace"))
+
+
+async def fetch_professor_bio_async(
+    profile_url: str | None, client: httpx.AsyncClient
+) -> Optional[str]:
+    """Async variant for concurrent ingestion; the caller owns the client."""
 
-def fetch_professor_bio(profile_url: str | None) -> Optional[str]:
     if OFFLINE or not profile_url:
         return None
     try:
-        with httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True) as client:
-            resp = client.get(profile_url)
+        async with client.stream("GET", profile_url) as resp:
             resp.raise_for_status()
+            chunks: list[bytes] = []
+            total = 0
+            async for chunk in resp.aiter_bytes():
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= _MAX_BIO_BYTES:
+                    break
+            encoding = resp.encoding or "utf-8"
     except Exception:
         return None
 
-    return extract_bio(resp.text)
+    return extract_bio(b"".join(chunks).decode(encoding, errors="replace"))
 
 
 def extract_bio(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
 
-    content_paras = soup.select(
-        "main p, article p, .field-name-body p, .provider-bio p, .bio p, .pane-node-body p"
-    )
+    content_paras = tree.css(_BIO_SELECTOR)
     for p in content_paras:
-        text = p.get_text(" ", strip=True)
+        text = p.text(separator=" ", strip=True)
         if len(text.split()) >= 12:
             return text
 
-    meta = soup.find("meta", attrs={"name": "description"})
-    if meta and meta.get("content"):
-        return meta["content"].strip() or None
+    # Both lookups run inside lexbor's C selector engine; "Description" is
+    # the capitalisation some CMSes emit.
+    meta = tree.css_first('meta[name="description"]') or tree.css_first(
+        'meta[name="Description"]'
+    )
+    if meta:
+        content = (meta.attributes.get("content") or "").strip()
+        if content:
+            return content
 
     return None
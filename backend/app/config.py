@@ -1,11 +1,15 @@
 import os
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
 def _as_bool(value: str) -> bool:
-    return value.lower() in {"1", "true", "yes", "on"}
+    return value.lower() in _TRUTHY
 
 
 OFFLINE = _as_bool(os.getenv("ENT_OFFLINE", "false"))
+HTTP_CACHE = _as_bool(os.getenv("ENT_HTTP_CACHE", "false"))
+STRICT_EMAIL = _as_bool(os.getenv("ENT_STRICT_EMAIL", "false"))
 HTTP_TIMEOUT = float(os.getenv("ENT_HTTP_TIMEOUT", "15"))
 USER_AGENT = os.getenv(
     "ENT_USER_AGENT",
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import json
 from typing import Iterable, List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .models import Collaborator, Institution, Professor, Publication, ResearchTag
 
+# Monotonic counter bumped on every write; cheap cache-invalidation signal
+# for read endpoints that serve memoized payloads.
+_data_version = 0
+
+
+def bump_data_version() -> None:
+    global _data_version
+    _data_version += 1
+
+
+def data_version() -> int:
+    return _data_version
+
 
 def upsert_institution(session: Session, name: str, website: Optional[str]) -> Institution:
+    bump_data_version()
     existing = session.scalar(select(Institution).where(Institution.name == name))
     if existing:
         if website and existing.website != website:
@@ -31,6 +47,7 @@ def upsert_professor(
     has_lab: bool = False,
     biography: Optional[str] = None,
 ) -> Professor:
+    bump_data_version()
     existing = session.scalar(
         select(Professor).where(
             Professor.name == name, Professor.institution_id == institution.id
@@ -61,37 +78,67 @@ def upsert_professor(
 
 
 def set_professor_tags(session: Session, professor: Professor, tags: Iterable[str]) -> None:
-    normalized = {tag.strip().lower() for tag in tags if tag.strip()}
+    bump_data_version()
+    seen: set[str] = set()
+    normalized: List[str] = []
+    for tag in tags:
+        name = tag.strip().lower()
+        if name and name not in seen:
+            seen.add(name)
+            normalized.append(name)
+
+    professor.top_tags = ",".join(normalized[:10])
     if not normalized:
         professor.tags = []
         return
 
-    tag_objects: List[ResearchTag] = []
-    for tag_name in normalized:
-        tag = session.scalar(select(ResearchTag).where(ResearchTag.name == tag_name))
-        if not tag:
-            tag = ResearchTag(name=tag_name)
-            session.add(tag)
-            session.flush()
-        tag_objects.append(tag)
+    existing = {
+        tag.name: tag
+        for tag in session.scalars(select(ResearchTag).where(ResearchTag.name.in_(normalized)))
+    }
+    new_tags = [ResearchTag(name=name) for name in normalized if name not in existing]
+    if new_tags:
+        session.add_all(new_tags)
+        session.flush()
 
-    professor.tags = tag_objects
+    professor.tags = list(existing.values()) + new_tags
 
 
 def upsert_publications(
     session: Session, professor: Professor, publications: Iterable[dict]
 ) -> List[Publication]:
-    saved = []
-    for pub in publications:
-        title = pub.get("title")
-        if not title:
-            continue
-        existing = session.scalar(
+    bump_data_version()
+    publications = [pub for pub in publications if pub.get("title")]
+    titles = [pub["title"] for pub in publications]
+    if not titles:
+        return []
+
+    # Keep the denormalized summary column current; string max works because
+    # dates are stored ISO-ordered.
+    dates = [d for d in (pub.get("published_on") for pub in publications) if d]
+    if dates:
+        newest = max(dates)
+        if not professor.latest_publication_date or newest > professor.latest_publication_date:
+            professor.latest_publication_date = newest
+
+    existing_by_title = {
+        p.title: p
+        for p in session.scalars(
             select(Publication).where(
-                Publication.professor_id == professor.id, Publication.title == title
+                Publication.professor_id == professor.id, Publication.title.in_(titles)
             )
         )
-        co_authors = ", ".join(pub.get("co_authors", []))
+    }
+
+    saved: List[Publication] = []
+    new_rows: List[dict] = []
+    seen_new_titles: set[str] = set()
+    for pub in publications:
+        # JSON keeps structure (names can contain commas); empty stays ""
+        # so the or-keep-existing update below still works.
+        names = pub.get("co_authors") or []
+        co_authors = json.dumps(names) if names else ""
+        existing = existing_by_title.get(pub["title"])
         if existing:
             existing.published_on = pub.get("published_on", existing.published_on)
             existing.link = pub.get("link", existing.link)
@@ -99,41 +146,89 @@ def upsert_publications(
             existing.abstract = pub.get("abstract", existing.abstract)
             saved.append(existing)
             continue
-        new_pub = Publication(
-            professor=professor,
-            title=title,
-            published_on=pub.get("published_on"),
-            link=pub.get("link"),
-            co_authors=co_authors,
-            abstract=pub.get("abstract"),
+        if pub["title"] in seen_new_titles:
+            continue
+        seen_new_titles.add(pub["title"])
+        new_rows.append(
+            {
+                "professor_id": professor.id,
+                "title": pub["title"],
+                "published_on": pub.get("published_on"),
+                "link": pub.get("link"),
+                "co_authors": co_authors,
+                "abstract": pub.get("abstract"),
+            }
+        )
+    if new_rows:
+        # Single executemany round-trip; the conflict target absorbs races
+        # with a concurrent refresh inserting the same titles.
+        session.execute(
+            sqlite_insert(Publication).on_conflict_do_nothing(
+                index_elements=["professor_id", "title"]
+            ),
+            new_rows,
+        )
+        saved.extend(
+            session.scalars(
+                select(Publication).where(
+                    Publication.professor_id == professor.id,
+                    Publication.title.in_(seen_new_titles),
+                )
+            )
         )
-        session.add(new_pub)
-        saved.append(new_pub)
     return saved
 
 
 def upsert_collaborators(
     session: Session, professor: Professor, collaborators: Iterable[dict]
 ) -> List[Collaborator]:
-    saved = []
-    for collaborator in collaborators:
-        name = collaborator.get("name")
-        if not name:
-            continue
-        existing = session.scalar(
+    bump_data_version()
+    collaborators = [c for c in collaborators if c.get("name")]
+    names = [c["name"] for c in collaborators]
+    if not names:
+        return []
+
+    existing_by_name = {
+        c.name: c
+        for c in session.scalars(
             select(Collaborator).where(
-                Collaborator.professor_id == professor.id, Collaborator.name == name
+                Collaborator.professor_id == professor.id, Collaborator.name.in_(names)
             )
         )
+    }
+
+    saved: List[Collaborator] = []
+    new_rows: List[dict] = []
+    seen_new_names: set[str] = set()
+    for collaborator in collaborators:
+        existing = existing_by_name.get(collaborator["name"])
         if existing:
             existing.affiliation = collaborator.get("affiliation", existing.affiliation)
             saved.append(existing)
             continue
-        new_c = Collaborator(
-            professor=professor,
-            name=name,
-            affiliation=collaborator.get("affiliation"),
+        if collaborator["name"] in seen_new_names:
+            continue
+        seen_new_names.add(collaborator["name"])
+        new_rows.append(
+            {
+                "professor_id": professor.id,
+                "name": collaborator["name"],
+                "affiliation": collaborator.get("affiliation"),
+            }
+        )
+    if new_rows:
+        session.execute(
+            sqlite_insert(Collaborator).on_conflict_do_nothing(
+                index_elements=["professor_id", "name"]
+            ),
+            new_rows,
+        )
+        saved.extend(
+            session.scalars(
+                select(Collaborator).where(
+                    Collaborator.professor_id == professor.id,
+                    Collaborator.name.in_(seen_new_names),
+                )
+            )
         )
-        session.add(new_c)
-        saved.append(new_c)
     return saved
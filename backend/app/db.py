@@ -2,7 +2,7 @@ import os
 from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy import inspect, text
 
@@ -10,7 +10,29 @@ from sqlalchemy import inspect, text
 DB_PATH = Path(os.getenv("ENT_DB_PATH", "data/ent_research.db"))
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
+engine = create_engine(
+    f"sqlite:///{DB_PATH}",
+    echo=False,
+    future=True,
+    connect_args={"check_same_thread": False},
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    WAL lets API readers proceed while ingestion writes; NORMAL sync and a
+    bigger cache keep the many small ingest writes off the critical path.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
@@ -39,3 +61,35 @@ def ensure_latest_schema() -> None:
     if "abstract" not in columns:
         with engine.begin() as conn:
             conn.execute(text("ALTER TABLE publications ADD COLUMN abstract TEXT"))
+    prof_columns = {col["name"] for col in inspector.get_columns("professors")}
+    if "top_tags" not in prof_columns:
+        with engine.begin() as conn:
+            conn.execute(
+                text("ALTER TABLE professors ADD COLUMN top_tags TEXT NOT NULL DEFAULT ''")
+            )
+    if "latest_publication_date" not in prof_columns:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "ALTER TABLE professors ADD COLUMN latest_publication_date VARCHAR(50)"
+                )
+            )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_professors_name_institution "
+                "ON professors (name, institution_id)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_professors_institution_id "
+                "ON professors (institution_id)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_publications_prof_date "
+                "ON publications (professor_id, published_on)"
+            )
+        )
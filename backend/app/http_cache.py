@@ -0,0 +1,64 @@
+"""
+On-disk HTML cache with ETag/Last-Modified revalidation for roster pages.
+
+Enabled with ENT_HTTP_CACHE=1 (off by default). Each URL maps to
+~/.cache/ent_radar/<sha256(url)>.html plus a .meta.json sidecar holding the
+validators; fetchers send them as conditional headers and serve the cached
+body on a 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+
+CACHE_DIR = Path(
+    os.getenv("ENT_HTTP_CACHE_PATH", str(Path.home() / ".cache" / "ent_radar"))
+)
+
+
+def _paths(url: str) -> Tuple[Path, Path]:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.html", CACHE_DIR / f"{digest}.meta.json"
+
+
+def load(url: str) -> Tuple[Optional[bytes], dict]:
+    """
+    Return (cached body, conditional request headers) for a URL. Either may
+    be empty when nothing usable is cached.
+    """
+    body_path, meta_path = _paths(url)
+    try:
+        html = body_path.read_bytes()
+        meta = json.loads(meta_path.read_text("utf-8"))
+    except (OSError, ValueError):
+        return None, {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return html, headers
+
+
+def store(url: str, html: bytes, response_headers: Mapping[str, str]) -> None:
+    """
+    Persist a fresh body plus its validators. Responses without an ETag or
+    Last-Modified cannot be revalidated and are not cached.
+    """
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    body_path, meta_path = _paths(url)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(html)
+        meta_path.write_text(
+            json.dumps({"etag": etag, "last_modified": last_modified}), "utf-8"
+        )
+    except OSError:
+        pass  # caching is best-effort; never fail the fetch over it
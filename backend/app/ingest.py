@@ -8,16 +8,23 @@ When ready to scrape live, unset ENT_OFFLINE to enable publication enrichment.
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 from typing import Iterable, List, Optional
 
+import httpx
+
 from . import crud
-from .config import OFFLINE
+from .config import HTTP_TIMEOUT, OFFLINE, USER_AGENT
 from .db import Base, engine, ensure_latest_schema, get_session
 from .models import Institution, Professor
-from .scrapers import fetch_institution_roster
-from .bio import fetch_professor_bio
-from .publications import fetch_publications, derive_tags
+from .scrapers import gather_all
+from .bio import fetch_professor_bio_async
+from .publications import fetch_publications_many, derive_tags
+
+# Bound on outstanding network fetches during a refresh; keeps the crawl
+# polite while still overlapping most of the per-professor latency.
+MAX_CONCURRENT_FETCHES = 20
 
 INSTITUTIONS = [
     {
@@ -43,36 +50,87 @@ def refresh_all() -> None:
     print("[ingest] Starting refresh...", flush=True)
     Base.metadata.create_all(bind=engine)
     ensure_latest_schema()
-    with get_session() as session:
-        if OFFLINE:
-            print("[ingest] ENT_OFFLINE set; seeding sample data.", flush=True)
-            seed_sample_data(session)
-            return
-        for inst_info in INSTITUTIONS:
-            print(f"[ingest] Processing {inst_info['name']}...", flush=True)
-            inst = crud.upsert_institution(session, inst_info["name"], inst_info["website"])
-            roster = fetch_institution_roster(inst)
-            print(f"[ingest] Found {len(roster)} roster entries for {inst.name}.", flush=True)
-            for entry in roster:
-                prof = crud.upsert_professor(
-                    session,
-                    name=entry.get("name", "").strip(),
-                    email=entry.get("email"),
-                    institution=inst,
-                    profile_url=entry.get("profile_url"),
-                )
-                if entry.get("profile_url") and not prof.biography:
-                    prof.biography = fetch_professor_bio(entry.get("profile_url"))
-
-                pubs = fetch_publications(prof, limit=20)
-                crud.upsert_publications(session, prof, pubs[:20])
-                tags = derive_tags(pubs, biography=prof.biography)
-                crud.set_professor_tags(session, prof, tags[:10])
-                prof.last_refreshed_at = dt.datetime.utcnow()
-                print(f"[ingest] Updated {prof.name}.", flush=True)
+    if OFFLINE:
+        print("[ingest] ENT_OFFLINE set; seeding sample data.", flush=True)
+        seed_sample_data()
+        return
+    asyncio.run(_refresh_all_async())
     print("[ingest] Refresh complete.", flush=True)
 
 
+async def _refresh_all_async() -> None:
+    """
+    Fan out the network-bound enrichment (bios + publications) concurrently
+    per institution, then apply results to the DB in a single sync pass so
+    SQLAlchemy writes stay on one thread.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    limits = httpx.Limits(
+        max_keepalive_connections=MAX_CONCURRENT_FETCHES,
+        max_connections=MAX_CONCURRENT_FETCHES,
+    )
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=limits,
+        http2=True,
+    ) as client:
+        with get_session() as session:
+            institutions = [
+                crud.upsert_institution(session, info["name"], info["website"])
+                for info in INSTITUTIONS
+            ]
+            # All rosters download concurrently over the shared client before
+            # the per-institution enrichment/DB pass below.
+            rosters = await gather_all(institutions, client)
+            for inst, roster in zip(institutions, rosters):
+                print(f"[ingest] Processing {inst.name}...", flush=True)
+                print(f"[ingest] Found {len(roster)} roster entries for {inst.name}.", flush=True)
+
+                profs: list[Professor] = []
+                for entry in roster:
+                    name = entry.name.strip()
+                    if not name:
+                        continue
+                    prof = crud.upsert_professor(
+                        session,
+                        name=name,
+                        email=entry.email,
+                        institution=inst,
+                        profile_url=entry.profile_url,
+                    )
+                    # Force-load the relationship now; enrichment tasks read
+                    # professor attributes off the main thread.
+                    _ = prof.institution.name
+                    profs.append(prof)
+
+                bios = await asyncio.gather(
+                    *(_fetch_bio(prof, semaphore, client) for prof in profs),
+                    return_exceptions=True,
+                )
+                pubs_lists = await fetch_publications_many(profs, limit=20)
+                for prof, biography, pubs in zip(profs, bios, pubs_lists):
+                    if isinstance(biography, BaseException):
+                        biography = None
+                    if biography and not prof.biography:
+                        prof.biography = biography
+                    crud.upsert_publications(session, prof, pubs[:20])
+                    tags = derive_tags(pubs, biography=prof.biography)
+                    crud.set_professor_tags(session, prof, tags[:10])
+                    prof.last_refreshed_at = dt.datetime.utcnow()
+                    print(f"[ingest] Updated {prof.name}.", flush=True)
+
+
+async def _fetch_bio(
+    prof: Professor, semaphore: asyncio.Semaphore, client: httpx.AsyncClient
+) -> Optional[str]:
+    async with semaphore:
+        if prof.profile_url and not prof.biography:
+            return await fetch_professor_bio_async(prof.profile_url, client)
+        return None
+
+
 def seed_sample_data(session=None) -> None:
     """
     Insert a small sample payload to exercise the UI/API without scraping.
@@ -84,7 +142,35 @@ def seed_sample_data(session=None) -> None:
         _seed(session)
 
 
+SAMPLE_PUBLICATIONS = [
+    {
+        "title": "Advances in Otolaryngology",
+        "published_on": "2023-11-01",
+        "link": "https://doi.org/example1",
+        "co_authors": ["A. Smith", "B. Chen"],
+        "abstract": "A survey of recent innovations in otolaryngology with emphasis on multidisciplinary care models and hearing restoration outcomes.",
+    },
+    {
+        "title": "Hearing Loss Interventions",
+        "published_on": "2022-06-15",
+        "link": "https://doi.org/example2",
+        "co_authors": ["C. Patel"],
+        "abstract": "Clinical trial results evaluating novel interventions for progressive hearing loss in adult populations.",
+    },
+]
+
+SAMPLE_COLLABORATORS = [
+    {"name": "A. Smith", "affiliation": "Sample Lab"},
+    {"name": "B. Chen"},
+]
+
+SAMPLE_TAGS = ["otology", "hearing loss", "cochlear implants"]
+
+
 def _seed(session):
+    # Everything lands in one transaction: the two parent upserts need their
+    # PKs, and the child payloads go through the executemany bulk paths in
+    # crud with a single statement each.
     inst = crud.upsert_institution(session, "Sample University", "https://example.edu")
     prof = crud.upsert_professor(
         session,
@@ -96,27 +182,7 @@ def _seed(session):
         has_lab=True,
         biography="Dr. Jane Doe leads translational research on hearing loss and cochlear implant outcomes, mentoring residents and collaborating across neurology and speech pathology.",
     )
-    pubs = [
-        {
-            "title": "Advances in Otolaryngology",
-            "published_on": "2023-11-01",
-            "link": "https://doi.org/example1",
-            "co_authors": ["A. Smith", "B. Chen"],
-            "abstract": "A survey of recent innovations in otolaryngology with emphasis on multidisciplinary care models and hearing restoration outcomes.",
-        },
-        {
-            "title": "Hearing Loss Interventions",
-            "published_on": "2022-06-15",
-            "link": "https://doi.org/example2",
-            "co_authors": ["C. Patel"],
-            "abstract": "Clinical trial results evaluating novel interventions for progressive hearing loss in adult populations.",
-        },
-    ]
-    crud.upsert_publications(session, prof, pubs)
-    crud.upsert_collaborators(
-        session,
-        prof,
-        [{"name": "A. Smith", "affiliation": "Sample Lab"}, {"name": "B. Chen"}],
-    )
-    crud.set_professor_tags(session, prof, ["otology", "hearing loss", "cochlear implants"])
+    crud.upsert_publications(session, prof, SAMPLE_PUBLICATIONS)
+    crud.upsert_collaborators(session, prof, SAMPLE_COLLABORATORS)
+    crud.set_professor_tags(session, prof, SAMPLE_TAGS)
     prof.last_refreshed_at = dt.datetime.utcnow()
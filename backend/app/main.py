@@ -1,22 +1,30 @@
+import asyncio
 import datetime as dt
+import hashlib
+import threading
+import time
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from . import crud
 from .config import OFFLINE
 from .db import Base, engine, get_session, ensure_latest_schema
-from .models import Institution, Professor
+from .models import Institution, Professor, ProfessorTag, Publication, ResearchTag
 from .schemas import ProfessorDetail, ProfessorSummary, UpdateEmailRequest
 from .publications import fetch_publications
-from .utils import has_recent_publication
+from .utils import decode_co_authors, has_recent_publication
 
 Base.metadata.create_all(bind=engine)
 ensure_latest_schema()
 
-app = FastAPI(title="ENT Research Tool", version="0.1.0")
+app = FastAPI(
+    title="ENT Research Tool", version="0.1.0", default_response_class=ORJSONResponse
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -36,42 +44,152 @@ def health() -> dict:
     return {"ok": True, "offline": OFFLINE}
 
 
+# Roster list cache: the data only changes during a refresh, so serve a
+# memoized JSON payload (with an ETag for client revalidation) until either
+# the TTL lapses or a CRUD write bumps the data version.
+_LIST_CACHE_TTL = 60.0
+# Serializes the whole summary list through pydantic's compiled core in one
+# call instead of per-row model_dump + json.dumps.
+_SUMMARY_ADAPTER = TypeAdapter(list[ProfessorSummary])
+_list_cache_lock = threading.Lock()
+_list_cache: dict | None = None
+
+
 @app.get("/professors", response_model=list[ProfessorSummary])
-def list_professors(db: Session = Depends(get_db)) -> list[ProfessorSummary]:
-    professors = db.scalars(
-        select(Professor).join(Institution).order_by(Institution.name, Professor.name)
+def list_professors(
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    global _list_cache
+    version = crud.data_version()
+    with _list_cache_lock:
+        cache = _list_cache
+    if cache and cache["version"] == version and time.monotonic() < cache["expires_at"]:
+        if if_none_match == cache["etag"]:
+            return Response(status_code=304, headers={"ETag": cache["etag"]})
+        return Response(
+            content=cache["payload"],
+            media_type="application/json",
+            headers={"ETag": cache["etag"]},
+        )
+
+    results = _build_professor_summaries(db)
+    payload = _SUMMARY_ADAPTER.dump_json(results)
+    etag = f'W/"{version}-{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    with _list_cache_lock:
+        _list_cache = {
+            "version": version,
+            "etag": etag,
+            "payload": payload,
+            "expires_at": time.monotonic() + _LIST_CACHE_TTL,
+        }
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+def _build_professor_summaries(db: Session) -> list[ProfessorSummary]:
+    rows = db.execute(
+        select(
+            Professor.id,
+            Professor.name,
+            Professor.email,
+            Institution.name.label("institution"),
+            Professor.top_tags,
+            Professor.latest_publication_date,
+        )
+        .join(Institution, Professor.institution_id == Institution.id)
+        .order_by(Institution.name, Professor.name)
     ).all()
+    # Professors ingested before latest_publication_date existed fall back
+    # to one aggregate restricted to just those rows.
+    missing_date_ids = [row.id for row in rows if row.latest_publication_date is None]
+    legacy_dates: dict[int, str | None] = {}
+    if missing_date_ids:
+        legacy_dates = dict(
+            db.execute(
+                select(Publication.professor_id, func.max(Publication.published_on))
+                .where(Publication.professor_id.in_(missing_date_ids))
+                .group_by(Publication.professor_id)
+            ).all()
+        )
+    # Rows ingested before top_tags existed still carry their tags only in
+    # the many-to-many table; fetch those in one bulk query instead of
+    # hydrating Professor objects.
+    missing_ids = [row.id for row in rows if not row.top_tags]
+    legacy_tags: dict[int, list[str]] = {}
+    if missing_ids:
+        tag_rows = db.execute(
+            select(ProfessorTag.professor_id, ResearchTag.name)
+            .join(ResearchTag, ProfessorTag.tag_id == ResearchTag.id)
+            .where(ProfessorTag.professor_id.in_(missing_ids))
+        ).all()
+        for professor_id, tag_name in tag_rows:
+            legacy_tags.setdefault(professor_id, []).append(tag_name)
+
     results: list[ProfessorSummary] = []
-    for prof in professors:
-        recent = has_recent_publication(prof.publications)
+    for row in rows:
+        if row.top_tags:
+            tags = [t for t in row.top_tags.split(",") if t]
+        else:
+            tags = legacy_tags.get(row.id, [])[:10]
+        latest = row.latest_publication_date or legacy_dates.get(row.id)
+        recent = has_recent_publication([{"published_on": latest}])
         results.append(
             ProfessorSummary(
-                id=prof.id,
-                name=prof.name,
-                email=prof.email,
-                institution=prof.institution.name,
-                tags=[t.name for t in prof.tags][:10],
+                id=row.id,
+                name=row.name,
+                email=row.email,
+                institution=row.institution,
+                tags=tags,
                 has_recent_publication=recent,
             )
         )
     return results
 
 
+def _refresh_prof_pubs(professor_id: int) -> None:
+    """Background refresh of a professor's publications in its own session."""
+    with get_session() as session:
+        prof = session.get(Professor, professor_id)
+        if not prof:
+            return
+        try:
+            # Runs on a worker thread, so it owns its own event loop.
+            fetched = asyncio.run(fetch_publications(prof, limit=20))
+            crud.upsert_publications(session, prof, fetched)
+            prof.last_refreshed_at = dt.datetime.utcnow()
+        except Exception as exc:  # defensive: background refresh must not raise
+            print(f"[error] refresh failed for professor {professor_id}: {exc}", flush=True)
+
+
 @app.get("/professors/{professor_id}", response_model=ProfessorDetail)
-def professor_detail(professor_id: int, db: Session = Depends(get_db)) -> ProfessorDetail:
-    prof = db.get(Professor, professor_id)
+def professor_detail(
+    professor_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+) -> ProfessorDetail:
+    prof = db.scalar(
+        select(Professor)
+        .where(Professor.id == professor_id)
+        .options(
+            joinedload(Professor.institution),
+            selectinload(Professor.tags),
+            selectinload(Professor.collaborators),
+        )
+    )
     if not prof:
         raise HTTPException(status_code=404, detail="Professor not found")
-    pubs = list(prof.publications)
+    # Sort and cap in SQL; the 20-newest window is all the response needs.
+    pubs = db.scalars(
+        select(Publication)
+        .where(Publication.professor_id == professor_id)
+        .order_by(Publication.published_on.desc().nulls_last())
+        .limit(20)
+    ).all()
     needs_refresh = (not pubs or len(pubs) < 20 or any(pub.abstract is None for pub in pubs)) and not OFFLINE
     if needs_refresh:
-        try:
-            fetched = fetch_publications(prof, limit=20)
-            crud.upsert_publications(db, prof, fetched)
-            prof.last_refreshed_at = dt.datetime.utcnow()
-            pubs = list(prof.publications)
-        except Exception as exc:  # defensive: never fail the endpoint on refresh
-            print(f"[error] refresh failed for professor {professor_id}: {exc}", flush=True)
+        # Serve whatever is stored now; the fetch happens after the response
+        # so the client never waits on external HTTP.
+        background_tasks.add_task(_refresh_prof_pubs, professor_id)
     return ProfessorDetail(
         id=prof.id,
         name=prof.name,
@@ -81,7 +199,11 @@ def professor_detail(professor_id: int, db: Session = Depends(get_db)) -> Profes
         h_index=prof.h_index,
         has_lab=prof.has_lab,
         biography=prof.biography,
-        has_recent_publication=has_recent_publication(pubs),
+        has_recent_publication=has_recent_publication(
+            [{"published_on": prof.latest_publication_date}]
+        )
+        if prof.latest_publication_date
+        else has_recent_publication(pubs),
         top_tags=[t.name for t in prof.tags][:10],
         publications=[
             {
@@ -89,10 +211,10 @@ def professor_detail(professor_id: int, db: Session = Depends(get_db)) -> Profes
                 "title": pub.title,
                 "published_on": pub.published_on,
                 "link": pub.link,
-                "co_authors": [c.strip() for c in pub.co_authors.split(",") if c.strip()],
+                "co_authors": decode_co_authors(pub.co_authors),
                 "abstract": pub.abstract,
             }
-            for pub in sorted(pubs, key=lambda p: p.published_on or "", reverse=True)[:20]
+            for pub in pubs
         ],
         collaborators=[
             {"id": c.id, "name": c.name, "affiliation": c.affiliation}
@@ -112,4 +234,5 @@ def update_professor_email(
     prof.email = payload.email.strip()
     db.add(prof)
     db.flush()
+    crud.bump_data_version()
     return {"id": prof.id, "email": prof.email}
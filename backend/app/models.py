@@ -1,7 +1,16 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
@@ -20,6 +29,12 @@ class Institution(Base):
 
 class Professor(Base):
     __tablename__ = "professors"
+    # upsert_professor probes on (name, institution_id); the unique
+    # constraints on the child tables already index their lookup columns.
+    __table_args__ = (
+        Index("ix_professors_name_institution", "name", "institution_id"),
+        Index("ix_professors_institution_id", "institution_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -28,6 +43,12 @@ class Professor(Base):
     institution_id: Mapped[int] = mapped_column(ForeignKey("institutions.id"), nullable=False)
     h_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     has_lab: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Comma-joined display tags (max 10), denormalized from the tag
+    # relationship at ingest time so list endpoints skip the JOIN.
+    top_tags: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    # Denormalized MAX(published_on) maintained by crud.upsert_publications;
+    # lets list/detail endpoints answer "recent?" without touching pubs.
+    latest_publication_date: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     biography: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     last_refreshed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -63,7 +84,11 @@ class ProfessorTag(Base):
 
 class Publication(Base):
     __tablename__ = "publications"
-    __table_args__ = (UniqueConstraint("professor_id", "title"),)
+    __table_args__ = (
+        UniqueConstraint("professor_id", "title"),
+        # Serves the per-professor newest-first window in the detail endpoint.
+        Index("ix_publications_prof_date", "professor_id", "published_on"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     professor_id: Mapped[int] = mapped_column(ForeignKey("professors.id"), nullable=False)
@@ -6,22 +6,97 @@ If ENT_OFFLINE=true, returns an empty list to avoid network calls.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import os
+import random
 import re
-from collections import Counter
-from typing import Iterable, List, Sequence
+import time
+import logging
+from collections import Counter, defaultdict
+from typing import Iterable, List, Optional, Sequence
 
 import httpx
+import orjson
+
+try:  # optional: disk-backed HTTP caching across runs
+    import hishel
+except ImportError:  # pragma: no cover
+    hishel = None
 
 from .config import HTTP_TIMEOUT, OFFLINE, USER_AGENT
 from .models import Professor
 
 
+log = logging.getLogger(__name__)
+
 SEMANTIC_BASE_URL = "https://api.semanticscholar.org/graph/v1"
 OPENALEX_BASE_URL = "https://api.openalex.org"
 HEADERS = {"User-Agent": USER_AGENT}
 OPENALEX_MAILTO = os.getenv("ENT_OPENALEX_MAILTO", "bodaateya@gmail.com")
 
+# OpenAlex's polite pool allows ~10 req/s; stay just under it.
+MAX_CONCURRENT_LOOKUPS = 9
+
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+
+# OpenAlex results change on the order of weeks, so cached responses are
+# served from disk for a day (stale ones allowed while revalidating). This
+# makes repeated refreshes and dev re-runs parse-only work.
+_HTTP_CACHE_DIR = os.getenv("ENT_HTTP_CACHE_DIR", ".cache/openalex")
+_HTTP_CACHE_TTL = 86400
+
+
+def _new_client() -> httpx.AsyncClient:
+    """
+    Client for OpenAlex/Semantic Scholar lookups. HTTP/2 lets the concurrent
+    per-professor requests multiplex over a single TLS connection instead of
+    paying a handshake per pooled socket. Clients are created per enrichment
+    batch (not at module scope) because their pools bind to the running
+    event loop.
+    """
+    # Pool settings live on the transport: client-level limits/http2 do not
+    # apply once an explicit transport is supplied.
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=True, limits=_LIMITS
+    )
+    if hishel is not None:
+        transport = hishel.AsyncCacheTransport(
+            transport=transport,
+            storage=hishel.AsyncFileStorage(
+                base_path=_HTTP_CACHE_DIR, ttl=_HTTP_CACHE_TTL
+            ),
+            controller=hishel.Controller(
+                cacheable_methods=["GET"], allow_stale=True
+            ),
+        )
+    return httpx.AsyncClient(transport=transport, headers=HEADERS, timeout=HTTP_TIMEOUT)
+
+
+async def _get(
+    client: httpx.AsyncClient, url: str, params: dict, tries: int = 4
+) -> httpx.Response:
+    """
+    GET with retries for rate limiting: a 429 waits out Retry-After when the
+    server sends one, otherwise backs off exponentially with a little jitter.
+    Anything else surfaces immediately through raise_for_status.
+    """
+    for attempt in range(tries):
+        resp = await client.get(url, params=params)
+        if resp.status_code == 429 and attempt < tries - 1:
+            try:
+                delay = float(resp.headers.get("Retry-After", 2**attempt))
+            except ValueError:
+                delay = float(2**attempt)
+            await asyncio.sleep(delay + random.random() * 0.2)
+            continue
+        resp.raise_for_status()
+        return resp
+    raise httpx.HTTPError(f"GET {url} failed after {tries} attempts")
+
+
 INSTITUTION_ALIASES = {
     "northwestern university": [
         "northwestern",
@@ -56,10 +131,27 @@ INSTITUTION_OPENALEX_IDS = {
     "rush medical school": "https://openalex.org/I1285301757",  # Rush University Medical Center
 }
 
-def fetch_publications(professor: Professor, limit: int = 20) -> List[dict]:
+# Flattened alias -> canonical key map so institution normalization is a
+# single dict lookup instead of a scan over INSTITUTION_ALIASES.
+_INSTITUTION_REVERSE_ALIAS = {
+    alias: key
+    for key, aliases in INSTITUTION_ALIASES.items()
+    for alias in [key, *aliases]
+}
+
+# The same professor/institution pair is resolved repeatedly across a crawl
+# and author ids change on the order of never; cache hits skip an HTTP
+# round trip for a day.
+_AUTHOR_ID_TTL = 24 * 3600.0
+_author_id_cache: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+async def fetch_publications(
+    professor: Professor, limit: int = 20, client: Optional[httpx.AsyncClient] = None
+) -> List[dict]:
     """
     Try OpenAlex first (name + institution disambiguation). Fall back to Semantic Scholar if
-    OpenAlex fails to return any results.
+    OpenAlex fails to return any results. Pass a shared client when fetching
+    for many professors so connections are reused.
     """
     if OFFLINE:
         return []
@@ -69,37 +161,124 @@ def fetch_publications(professor: Professor, limit: int = 20) -> List[dict]:
     if not name_options:
         return []
 
-    pubs = _fetch_from_openalex(professor, name_options, limit)
+    if client is None:
+        async with _new_client() as owned:
+            return await _fetch_publications(professor, name_options, limit, owned)
+    return await _fetch_publications(professor, name_options, limit, client)
+
+
+async def fetch_publications_many(
+    professors: Sequence[Professor], limit: int = 20
+) -> List[List[dict]]:
+    """
+    Fetch publications for many professors concurrently over one shared
+    client, bounded to stay inside OpenAlex's polite rate limit. Returns one
+    list per professor, in order; failures yield empty lists.
+    """
+    if OFFLINE or not professors:
+        return [[] for _ in professors]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    by_institution: dict[str | None, list[Professor]] = {}
+    for professor in professors:
+        key = professor.institution.name if professor.institution else None
+        by_institution.setdefault(key, []).append(professor)
+
+    async with _new_client() as client:
+        # Prime the author-id cache up front: one batched request covers up
+        # to 50 professors, so the per-professor resolve step below is
+        # usually a cache hit instead of its own round trip.
+        for institution, group in by_institution.items():
+            try:
+                await _resolve_openalex_authors_bulk(
+                    client,
+                    [name_variants(normalize_professor_name(p.name)) for p in group],
+                    institution,
+                )
+            except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+                # Per-professor resolution still works without the cache.
+                log.warning(
+                    "bulk author resolve failed inst=%s err=%s", institution, exc
+                )
+
+        async def one(professor: Professor) -> List[dict]:
+            async with semaphore:
+                return await fetch_publications(professor, limit, client)
+
+        results = await asyncio.gather(
+            *(one(p) for p in professors), return_exceptions=True
+        )
+    return [r if isinstance(r, list) else [] for r in results]
+
+
+async def _fetch_publications(
+    professor: Professor, name_options: Sequence[str], limit: int, client: httpx.AsyncClient
+) -> List[dict]:
+    pubs = await _fetch_from_openalex(professor, name_options, limit, client)
     if pubs:
         return pubs[:limit]
 
-    pubs = _fetch_from_semantic_scholar(professor, name_options[0], limit)
+    pubs = await _fetch_from_semantic_scholar(professor, name_options[0], limit, client)
     return pubs[:limit]
 
 
-def _fetch_from_openalex(professor: Professor, name_options: Sequence[str], limit: int) -> List[dict]:
+async def _fetch_from_openalex(
+    professor: Professor,
+    name_options: Sequence[str],
+    limit: int,
+    client: httpx.AsyncClient,
+) -> List[dict]:
     institution = professor.institution.name if professor.institution else None
     try:
-        with httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT) as client:
-            author_id = _resolve_openalex_author(client, name_options, institution)
-            if author_id:
-                pubs = _fetch_openalex_works(client, author_id, institution, professor.name, limit)
-                if pubs:
-                    return pubs
-            # Fallback: text search by name + institution without an author id.
-            return _search_openalex_works(client, name_options, institution, professor.name, limit)
-    except Exception:
+        # Common path: one round trip filtering works by raw author name +
+        # institution, skipping the author-resolve request entirely.
+        pubs = await _fetch_openalex_works_by_name(
+            client, name_options[0], institution, professor.name, limit
+        )
+        if pubs:
+            return pubs
+
+        author_id = await _resolve_openalex_author(client, name_options, institution)
+        if author_id:
+            pubs = await _fetch_openalex_works(
+                client, author_id, institution, professor.name, limit
+            )
+            if pubs:
+                return pubs
+        # Fallback: text search by name + institution without an author id.
+        return await _search_openalex_works(
+            client, name_options, institution, professor.name, limit
+        )
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        log.warning(
+            "openalex fetch failed name=%s inst=%s err=%s",
+            professor.name,
+            institution,
+            exc,
+        )
         return []
 
 
-def _resolve_openalex_author(
-    client: httpx.Client, name_options: Sequence[str], institution: str | None
+async def _resolve_openalex_author(
+    client: httpx.AsyncClient, name_options: Sequence[str], institution: str | None
 ) -> str | None:
+    cache_key = (name_options[0].lower(), (institution or "").lower())
+    cached = _author_id_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _AUTHOR_ID_TTL:
+        return cached[1]
+
     best: dict | None = None
     best_score = 0.0
     inst_filter = _institution_filter(institution, for_authors=True)
-
-    for name in name_options:
+    seen_ids: set[str] = set()
+
+    for index, name in enumerate(name_options):
+        # OpenAlex search is fuzzy enough that the canonical name usually
+        # resolves on the first query; only try the remaining variants when
+        # that one leaves us unconvinced.
+        if index > 0 and best_score >= 3.0:
+            break
         params = {
             "search": name,
             "per-page": 5,
@@ -108,17 +287,107 @@ def _resolve_openalex_author(
         }
         if inst_filter:
             params["filter"] = inst_filter
-        resp = client.get(f"{OPENALEX_BASE_URL}/authors", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+        resp = await _get(client, f"{OPENALEX_BASE_URL}/authors", params)
+        data = orjson.loads(resp.content)
         for candidate in data.get("results", []):
+            candidate_id = candidate.get("id")
+            if candidate_id:
+                if candidate_id in seen_ids:
+                    continue  # already scored via an earlier variant
+                seen_ids.add(candidate_id)
             score = _score_author_candidate(candidate, name, institution)
             if score > best_score:
                 best_score = score
                 best = candidate
         if best_score >= 5:
             break  # confident enough
-    return best.get("id") if best else None
+
+    author_id = best.get("id") if best else None
+    _author_id_cache[cache_key] = (now, author_id)
+    return author_id
+
+
+async def _resolve_openalex_authors_bulk(
+    client: httpx.AsyncClient,
+    name_options_per_prof: Sequence[Sequence[str]],
+    institution: str | None,
+    batch_size: int = 50,
+) -> None:
+    """
+    Resolve many professors' OpenAlex author ids at once by |-joining their
+    names into a single display_name.search filter (one request per
+    `batch_size` names). Results land in the author-id cache; names with no
+    confident candidate are left uncached so the per-professor path can
+    still try their other variants.
+    """
+    inst_key = (institution or "").lower()
+    now = time.monotonic()
+    pending: list[Sequence[str]] = []
+    for options in name_options_per_prof:
+        if not options:
+            continue
+        cached = _author_id_cache.get((options[0].lower(), inst_key))
+        if cached and now - cached[0] < _AUTHOR_ID_TTL:
+            continue
+        pending.append(options)
+    if not pending:
+        return
+
+    inst_filter = _institution_filter(institution, for_authors=True)
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        # options[0] is the canonical cleaned form (see name_variants), but
+        # scrub commas anyway: a comma inside a filter value would read as a
+        # filter delimiter to OpenAlex and 400 the whole batch.
+        name_filter = "display_name.search:" + "|".join(
+            '"{}"'.format(" ".join(options[0].replace(",", " ").split()))
+            for options in batch
+        )
+        filters = [name_filter]
+        if inst_filter:
+            filters.append(inst_filter)
+        params = {
+            "filter": ",".join(filters),
+            "per-page": 50,
+            "select": "id,display_name,works_count,cited_by_count,last_known_institutions,affiliations,x_concepts",
+            "mailto": OPENALEX_MAILTO,
+        }
+        candidates: list[dict] = []
+        cursor: str | None = "*"
+        while cursor:
+            resp = await _get(
+                client, f"{OPENALEX_BASE_URL}/authors", {**params, "cursor": cursor}
+            )
+            data = orjson.loads(resp.content)
+            candidates.extend(data.get("results", []))
+            cursor = (data.get("meta") or {}).get("next_cursor")
+            if len(candidates) >= 4 * batch_size:
+                break  # plenty to map the batch; don't page unboundedly
+
+        # Cheap last-name prefilter: full scoring (normalization + fuzzy
+        # matching + concept checks) only runs against candidates sharing the
+        # target's surname token, which is usually one or two per name.
+        candidates_by_last: dict[str, list[dict]] = defaultdict(list)
+        for candidate in candidates:
+            parts = (candidate.get("display_name") or "").lower().split()
+            if parts:
+                candidates_by_last[parts[-1]].append(candidate)
+
+        now = time.monotonic()
+        for options in batch:
+            # Surname works for both spellings: the last token of "First
+            # Last", or the part before the comma in "Last, First".
+            target_last = options[0].split(",", 1)[0].split()[-1].lower()
+            pool = candidates_by_last.get(target_last) or candidates
+            best_id: str | None = None
+            best_score = 0.0
+            for candidate in pool:
+                score = _score_author_candidate(candidate, options[0], institution)
+                if score > best_score:
+                    best_score = score
+                    best_id = candidate.get("id")
+            if best_score >= 3.0:
+                _author_id_cache[(options[0].lower(), inst_key)] = (now, best_id)
 
 
 def _score_author_candidate(candidate: dict, target_name: str, institution: str | None) -> float:
@@ -150,8 +419,72 @@ def _score_author_candidate(candidate: dict, target_name: str, institution: str
     return score
 
 
-def _fetch_openalex_works(
-    client: httpx.Client,
+async def _fetch_openalex_works_by_name(
+    client: httpx.AsyncClient,
+    name: str,
+    institution: str | None,
+    professor_name: str,
+    limit: int,
+) -> List[dict]:
+    """
+    Single-request works lookup: filter on raw_author_name plus the known
+    institution id. Only usable when we have an OpenAlex institution id to
+    pin the match; without it the name filter alone is too ambiguous.
+    """
+    inst_id = _institution_id(institution) if institution else None
+    if not inst_id:
+        return []
+
+    params = {
+        "filter": (
+            f'raw_author_name.search:"{name}",authorships.institutions.id:{inst_id}'
+        ),
+        "sort": "publication_year:desc",
+        "per-page": min(limit, 25),
+        "select": "id,doi,display_name,authorships,publication_year,primary_location,publication_date,abstract_inverted_index",
+        "mailto": OPENALEX_MAILTO,
+    }
+    resp = await _get(client, f"{OPENALEX_BASE_URL}/works", params)
+    data = orjson.loads(resp.content)
+    # The two filters AND at the work level, not within one authorship, so
+    # keep only works where the professor themselves appears under the
+    # pinned institution; a miss here falls through to the author-id flow.
+    results = [
+        item
+        for item in data.get("results", [])
+        if _work_authorship_matches(item, professor_name, inst_id)
+    ]
+    target_norm = normalize_professor_name(professor_name).lower()
+    pubs = [_map_openalex_work(item, professor_name, target_norm) for item in results]
+    pubs = _filter_ent_publications(pubs)
+    return _dedupe_publications(pubs, limit)
+
+
+def _work_authorship_matches(item: dict, professor_name: str, inst_id: str) -> bool:
+    """
+    True when some authorship both resembles the professor's name and
+    carries the given OpenAlex institution id. Guards the by-name works
+    lookup against namesakes at other universities who merely co-authored
+    with someone at the target institution.
+    """
+    for authorship in item.get("authorships") or []:
+        raw = authorship.get("raw_author_name") or (
+            (authorship.get("author") or {}).get("display_name") or ""
+        )
+        if not raw:
+            continue
+        candidate = normalize_professor_name(raw)
+        if _name_similarity_score(candidate, professor_name) < 3.0:
+            continue
+        for inst in authorship.get("institutions") or []:
+            candidate_id = (inst.get("id") or "").rsplit("/", 1)[-1]
+            if candidate_id == inst_id.rsplit("/", 1)[-1]:
+                return True
+    return False
+
+
+async def _fetch_openalex_works(
+    client: httpx.AsyncClient,
     author_id: str,
     institution: str | None,
     professor_name: str,
@@ -169,22 +502,26 @@ def _fetch_openalex_works(
         "select": "id,doi,display_name,authorships,publication_year,primary_location,publication_date,abstract_inverted_index",
         "mailto": OPENALEX_MAILTO,
     }
-    resp = client.get(f"{OPENALEX_BASE_URL}/works", params=params)
-    resp.raise_for_status()
-    data = resp.json()
-    pubs = [_map_openalex_work(item, professor_name) for item in data.get("results", [])]
+    resp = await _get(client, f"{OPENALEX_BASE_URL}/works", params)
+    data = orjson.loads(resp.content)
+    target_norm = normalize_professor_name(professor_name).lower()
+    pubs = [
+        _map_openalex_work(item, professor_name, target_norm)
+        for item in data.get("results", [])
+    ]
     pubs = _filter_ent_publications(pubs)
-    return _dedupe_publications(pubs)
+    return _dedupe_publications(pubs, limit)
 
 
-def _search_openalex_works(
-    client: httpx.Client,
+async def _search_openalex_works(
+    client: httpx.AsyncClient,
     name_options: Sequence[str],
     institution: str | None,
     professor_name: str,
     limit: int,
 ) -> List[dict]:
     inst_filter = _institution_filter(institution, for_authors=False)
+    target_norm = normalize_professor_name(professor_name).lower()
     for name in name_options:
         params = {
             "search": name,
@@ -195,22 +532,24 @@ def _search_openalex_works(
         }
         if inst_filter:
             params["filter"] = inst_filter
-        resp = client.get(f"{OPENALEX_BASE_URL}/works", params=params)
-        resp.raise_for_status()
-        data = resp.json()
-        pubs = [_map_openalex_work(item, professor_name) for item in data.get("results", [])]
+        resp = await _get(client, f"{OPENALEX_BASE_URL}/works", params)
+        data = orjson.loads(resp.content)
+        pubs = [
+            _map_openalex_work(item, professor_name, target_norm)
+            for item in data.get("results", [])
+        ]
         pubs = _filter_ent_publications(pubs)
         if pubs:
-            return _dedupe_publications(pubs)
+            return _dedupe_publications(pubs, limit)
     return []
 
 
-def _map_openalex_work(item: dict, professor_name: str) -> dict:
+def _map_openalex_work(item: dict, professor_name: str, target_norm: str) -> dict:
     return {
         "title": item.get("display_name"),
         "published_on": _openalex_published_on(item),
         "link": _openalex_link(item),
-        "co_authors": _openalex_coauthors(item, professor_name),
+        "co_authors": _openalex_coauthors(item, professor_name, target_norm),
         "abstract": _openalex_abstract(item),
     }
 
@@ -235,14 +574,18 @@ def _openalex_link(item: dict) -> str | None:
     return None
 
 
-def _openalex_coauthors(item: dict, professor_name: str) -> list[str]:
+def _openalex_coauthors(item: dict, professor_name: str, target_norm: str) -> list[str]:
     names = []
     for auth in item.get("authorships") or []:
         author = auth.get("author") or {}
         name = author.get("display_name")
         if name:
             names.append(name)
-    if professor_name and not any(_names_match(n, professor_name) for n in names):
+    # The caller normalizes the professor's name once per request; compare
+    # against a normalized set instead of pairwise _names_match calls.
+    if professor_name and target_norm not in {
+        normalize_professor_name(n).lower() for n in names
+    }:
         names.insert(0, professor_name)
     return names
 
@@ -251,30 +594,39 @@ def _openalex_abstract(item: dict) -> str | None:
     inverted = item.get("abstract_inverted_index") or {}
     if not inverted:
         return None
-    # Convert inverted index to readable abstract.
-    tokens = []
+    # Convert inverted index to readable abstract. Positions are dense
+    # non-negative ints, so place words directly instead of sorting tuples.
+    try:
+        size = max(max(positions) for positions in inverted.values() if positions) + 1
+    except ValueError:
+        return None
+    out: list[str | None] = [None] * size
     for word, positions in inverted.items():
         for pos in positions:
-            tokens.append((pos, word))
-    tokens.sort(key=lambda t: t[0])
-    return " ".join(word for _, word in tokens)
+            out[pos] = word
+    return " ".join(word for word in out if word is not None)
 
 
-def _dedupe_publications(pubs: Iterable[dict]) -> List[dict]:
-    seen = set()
-    unique: List[dict] = []
+def _dedupe_publications(pubs: Iterable[dict], limit: int | None = None) -> List[dict]:
+    by_title: dict[str, dict] = {}
     for pub in pubs:
         title = (pub.get("title") or "").strip().lower()
-        if not title or title in seen:
-            continue
-        seen.add(title)
-        unique.append(pub)
-    unique.sort(key=lambda p: p.get("published_on") or "", reverse=True)
-    return unique
+        if title and title not in by_title:
+            by_title[title] = pub
+    if limit is not None:
+        # Newest `limit` entries only: O(n log k) instead of a full sort.
+        return heapq.nlargest(
+            limit, by_title.values(), key=lambda p: p.get("published_on") or ""
+        )
+    return sorted(
+        by_title.values(), key=lambda p: p.get("published_on") or "", reverse=True
+    )
 
 
-def _fetch_from_semantic_scholar(professor: Professor, cleaned_name: str, limit: int) -> List[dict]:
-    author_id = _lookup_semantic_author_id(professor, cleaned_name)
+async def _fetch_from_semantic_scholar(
+    professor: Professor, cleaned_name: str, limit: int, client: httpx.AsyncClient
+) -> List[dict]:
+    author_id = await _lookup_semantic_author_id(professor, cleaned_name, client)
     if not author_id:
         return []
     params = {
@@ -282,11 +634,16 @@ def _fetch_from_semantic_scholar(professor: Professor, cleaned_name: str, limit:
         "fields": "title,abstract,year,publicationDate,url,authors,externalIds",
     }
     try:
-        with httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT) as client:
-            resp = client.get(f"{SEMANTIC_BASE_URL}/author/{author_id}/papers", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-    except Exception:
+        resp = await client.get(f"{SEMANTIC_BASE_URL}/author/{author_id}/papers", params=params)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        log.warning(
+            "semantic scholar papers fetch failed name=%s author_id=%s err=%s",
+            professor.name,
+            author_id,
+            exc,
+        )
         return []
     results = []
     for item in data.get("data", []):
@@ -303,7 +660,9 @@ def _fetch_from_semantic_scholar(professor: Professor, cleaned_name: str, limit:
     return results
 
 
-def _lookup_semantic_author_id(professor: Professor, cleaned_name: str) -> str | None:
+async def _lookup_semantic_author_id(
+    professor: Professor, cleaned_name: str, client: httpx.AsyncClient
+) -> str | None:
     query = f"{cleaned_name} {professor.institution.name}"
     params = {
         "query": query,
@@ -311,70 +670,79 @@ def _lookup_semantic_author_id(professor: Professor, cleaned_name: str) -> str |
         "fields": "authorId,name,affiliations",
     }
     try:
-        with httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT) as client:
-            resp = client.get(f"{SEMANTIC_BASE_URL}/author/search", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-    except Exception:
+        resp = await client.get(f"{SEMANTIC_BASE_URL}/author/search", params=params)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        log.warning("semantic scholar author search failed query=%s err=%s", query, exc)
         return None
     if not data.get("data"):
         return None
     return data["data"][0].get("authorId")
 
 
+_CREDENTIAL_TOKENS = (
+    "md",
+    "do",
+    "phd",
+    "mph",
+    "ms",
+    "msn",
+    "mscr",
+    "mspa",
+    "msp",
+    "aud",
+    "np",
+    "aprn",
+    "pa",
+    "pa-c",
+    "rn",
+    "bsn",
+    "fnp",
+    "anp",
+    "cnp",
+    "acnp",
+    "agnp",
+    "facs",
+    "ccc-slp",
+    "faap",
+    "cnm",
+    "dnp",
+    "mba",
+)
+
+# normalize_professor_name runs for every co-author comparison, so its
+# patterns are compiled once here instead of per call.
+_WS_RE = re.compile(r"\s+")
+_WS_COMMA_RE = re.compile(r"[,\s]+")
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_SPECIALTY_RE = re.compile(r"\b(otolaryngology|ent|pediatric|pediatrics)\b", re.I)
+_CRED_RE = re.compile(r",?\s*\b(" + "|".join(_CREDENTIAL_TOKENS) + r")\b\.?", re.I)
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_professor_name(name: str) -> str:
     """
     Remove credentials, specialties, and extra whitespace to improve matching.
     """
-    cleaned = re.sub(r"\s+", " ", name.replace("\n", " ")).strip()
-    cleaned = re.sub(r"\([^)]*\)", "", cleaned)  # drop parentheses like (ENT)
-    cleaned = re.split(r"\b(otolaryngology|ent|pediatric|pediatrics)\b", cleaned, flags=re.I)[0]
-    credential_tokens = (
-        "md",
-        "do",
-        "phd",
-        "mph",
-        "ms",
-        "msn",
-        "mscr",
-        "mspa",
-        "msp",
-        "aud",
-        "np",
-        "aprn",
-        "pa",
-        "pa-c",
-        "rn",
-        "bsn",
-        "fnp",
-        "anp",
-        "cnp",
-        "acnp",
-        "agnp",
-        "facs",
-        "ccc-slp",
-        "faap",
-        "cnm",
-        "dnp",
-        "mba",
-    )
-    cleaned = re.sub(
-        r",?\s*\b(" + "|".join(credential_tokens) + r")\b\.?", "",
-        cleaned,
-        flags=re.I,
-    )
-    cleaned = cleaned.replace(",", " ")
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    cleaned = _WS_RE.sub(" ", name.replace("\n", " ")).strip()
+    cleaned = _PAREN_RE.sub("", cleaned)  # drop parentheses like (ENT)
+    cleaned = _SPECIALTY_RE.split(cleaned, maxsplit=1)[0]
+    cleaned = _CRED_RE.sub("", cleaned)
+    # One pass collapses commas and runs of whitespace together.
+    return _WS_COMMA_RE.sub(" ", cleaned).strip()
 
 
 def name_variants(cleaned_name: str) -> List[str]:
+    # Ordered, cleaned name first: callers treat index 0 as the canonical
+    # form (resolve queries, author-id cache keys, surname prefilter), so
+    # the order must not depend on set iteration.
+    variants = [cleaned_name]
     parts = cleaned_name.split()
-    variants = {cleaned_name}
     if len(parts) >= 2:
-        variants.add(f"{parts[0]} {parts[-1]}")
-        variants.add(f"{parts[-1]}, {parts[0]}")
-    return [v for v in variants if v]
+        variants.append(f"{parts[0]} {parts[-1]}")
+        variants.append(f"{parts[-1]}, {parts[0]}")
+    return [v for v in dict.fromkeys(variants) if v]
 
 
 def _institution_filter(institution: str | None, *, for_authors: bool) -> str | None:
@@ -387,11 +755,13 @@ def _institution_filter(institution: str | None, *, for_authors: bool) -> str |
     return f"{field}:{inst_id}"
 
 
+@functools.lru_cache(maxsize=256)
 def _institution_aliases(institution: str) -> List[str]:
     key = _institution_key(institution)
     return INSTITUTION_ALIASES.get(key, [key])
 
 
+@functools.lru_cache(maxsize=256)
 def _institution_id(institution: str) -> str | None:
     key = _institution_key(institution)
     if key in INSTITUTION_OPENALEX_IDS:
@@ -401,10 +771,7 @@ def _institution_id(institution: str) -> str | None:
 
 def _institution_key(name: str) -> str:
     normalized = name.lower().strip()
-    for key, aliases in INSTITUTION_ALIASES.items():
-        if normalized == key or normalized in aliases:
-            return key
-    return normalized
+    return _INSTITUTION_REVERSE_ALIAS.get(normalized, normalized)
 
 
 def _institution_matches(candidate: str, aliases: Sequence[str]) -> bool:
@@ -412,6 +779,13 @@ def _institution_matches(candidate: str, aliases: Sequence[str]) -> bool:
     return any(alias in candidate_norm for alias in aliases)
 
 
+try:  # optional: C-accelerated fuzzy name scoring
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz.distance import JaroWinkler as _rf_jarowinkler
+except ImportError:  # pragma: no cover
+    _rf_fuzz = None
+
+
 def _name_similarity_score(candidate: str, target: str) -> float:
     cand_parts = candidate.split()
     target_parts = target.split()
@@ -419,6 +793,14 @@ def _name_similarity_score(candidate: str, target: str) -> float:
         return 0.0
     if _names_match(candidate, target):
         return 4.0
+    if _rf_fuzz is not None:
+        # Fuzzy scoring handles initial-vs-full-first-name and hyphenated
+        # surnames that the token comparison below misses.
+        jw = _rf_jarowinkler.normalized_similarity(candidate, target)
+        if jw > 0.93:
+            return 4.0 * jw
+        tset = _rf_fuzz.token_set_ratio(candidate, target) / 100.0
+        return 3.0 * tset if tset > 0.8 else 0.5 * tset
     if cand_parts[-1] == target_parts[-1]:
         if cand_parts[0][0:1] == target_parts[0][0:1]:
             return 3.0
@@ -456,10 +838,35 @@ ENT_KEYWORDS = {
     "reconstructive": "reconstructive surgery",
     "allergy": "allergy",
 }
-ENT_KEYWORD_TERMS = {k.lower() for k in ENT_KEYWORDS.keys()}
+# Frozen at import: membership scans in _filter_ent_publications run per
+# publication and never mutate the set.
+ENT_KEYWORD_TERMS = frozenset(k.lower() for k in ENT_KEYWORDS)
+
+# Multi-pattern scan support for derive_tags: one Aho-Corasick pass over the
+# biography instead of one regex pass per phrase. pyahocorasick is optional;
+# without it a single precompiled alternation (longest phrase first, so
+# "cochlear implants" wins over "cochlear implant") does the same in one pass.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _ENT_AUTOMATON = ahocorasick.Automaton()
+    for _phrase, _canonical in ENT_KEYWORDS.items():
+        _ENT_AUTOMATON.add_word(_phrase, (len(_phrase), _canonical))
+    _ENT_AUTOMATON.make_automaton()
+else:
+    _ENT_AUTOMATON = None
+
+_ENT_KEYWORD_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(p) for p in sorted(ENT_KEYWORDS, key=len, reverse=True))
+    + r")\b"
+)
 
 # Concepts that should be present for ENT faculty; used to disambiguate OpenAlex authors.
-ENT_CONCEPT_TERMS = {
+ENT_CONCEPT_TERMS = frozenset({
     "otolaryngology",
     "otorhinolaryngology",
     "head and neck surgery",
@@ -471,7 +878,7 @@ ENT_CONCEPT_TERMS = {
     "laryngology",
     "sinusitis",
     "sleep medicine",
-}
+})
 
 
 def derive_tags(publications: Iterable[dict], biography: str | None = None) -> List[str]:
@@ -484,41 +891,57 @@ def derive_tags(publications: Iterable[dict], biography: str | None = None) -> L
 
     combined = biography.lower()
     counts = Counter()
-    for phrase, canonical in ENT_KEYWORDS.items():
-        hits = re.findall(rf"\b{re.escape(phrase)}\b", combined)
-        if hits:
-            counts[canonical] += len(hits)
+    if _ENT_AUTOMATON is not None:
+        for end, (phrase_len, canonical) in _ENT_AUTOMATON.iter(combined):
+            start = end - phrase_len + 1
+            # Emulate the old \b anchors around each match.
+            if start > 0 and combined[start - 1].isalnum():
+                continue
+            if end + 1 < len(combined) and combined[end + 1].isalnum():
+                continue
+            counts[canonical] += 1
+    else:
+        for match in _ENT_KEYWORD_RE.finditer(combined):
+            counts[ENT_KEYWORDS[match.group(1)]] += 1
 
     if counts:
         return [t for t, _ in counts.most_common(10)]
 
-    tokens = normalize_terms(biography)
-    counts = Counter(tokens)
+    # The biography was lowered once above; tokenize that same string rather
+    # than lowering it again.
+    counts = Counter(_tokenize_lowered(combined))
     return [t for t, _ in counts.most_common(10)]
 
 
+_NONALPHA_RE = re.compile(r"[^a-zA-Z\s]")
+
+_STOPWORDS = frozenset({
+    "with",
+    "from",
+    "this",
+    "that",
+    "into",
+    "using",
+    "study",
+    "case",
+    "role",
+    "professor",
+    "assistant",
+    "associate",
+    "doctor",
+    "clinical",
+    "medicine",
+    "department",
+})
+
+
 def normalize_terms(text: str) -> List[str]:
-    cleaned = re.sub(r"[^a-zA-Z\s]", " ", text).lower()
-    words = [w for w in cleaned.split() if len(w) > 3]
-    stop = {
-        "with",
-        "from",
-        "this",
-        "that",
-        "into",
-        "using",
-        "study",
-        "case",
-        "role",
-        "professor",
-        "assistant",
-        "associate",
-        "doctor",
-        "clinical",
-        "medicine",
-        "department",
-    }
-    return [w for w in words if w not in stop]
+    return _tokenize_lowered(text.lower())
+
+
+def _tokenize_lowered(lowered: str) -> List[str]:
+    words = _NONALPHA_RE.sub(" ", lowered).split()
+    return [w for w in words if len(w) > 3 and w not in _STOPWORDS]
 
 
 def _concept_score(concepts: Sequence[dict]) -> float:
@@ -573,8 +996,10 @@ def _published_on(item: dict) -> str | None:
 
 def _co_authors(item: dict, professor_name: str | None) -> list[str]:
     names = [a.get("name") for a in item.get("authors", []) if a.get("name")]
-    if professor_name and not any(_names_match(n, professor_name) for n in names):
-        names.insert(0, professor_name)
+    if professor_name:
+        target_norm = normalize_professor_name(professor_name).lower()
+        if target_norm not in {normalize_professor_name(n).lower() for n in names}:
+            names.insert(0, professor_name)
     return names
 
 
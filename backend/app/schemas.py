@@ -1,10 +1,19 @@
+import re
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from .config import STRICT_EMAIL
+
+# Syntax-only check; ENT_STRICT_EMAIL=1 restores the full email-validator
+# pass (IDN handling etc.) at the cost of importing it per process.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 class PublicationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     title: str
     published_on: Optional[str] = None
@@ -12,20 +21,18 @@ class PublicationOut(BaseModel):
     co_authors: List[str] = []
     abstract: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class CollaboratorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
     affiliation: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ProfessorSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
     email: Optional[str]
@@ -33,11 +40,10 @@ class ProfessorSummary(BaseModel):
     tags: List[str]
     has_recent_publication: bool = False
 
-    class Config:
-        from_attributes = True
-
 
 class ProfessorDetail(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
     email: Optional[str]
@@ -52,9 +58,18 @@ class ProfessorDetail(BaseModel):
     collaborators: List[CollaboratorOut]
     last_refreshed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-
 
 class UpdateEmailRequest(BaseModel):
-    email: EmailStr
+    email: str
+
+    @field_validator("email")
+    @classmethod
+    def _check_email(cls, value: str) -> str:
+        value = value.strip()
+        if STRICT_EMAIL:
+            from pydantic import validate_email
+
+            return validate_email(value)[1]
+        if not _EMAIL_RE.fullmatch(value):
+            raise ValueError("value is not a valid email address")
+        return value
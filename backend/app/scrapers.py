@@ -7,19 +7,109 @@ callers should use sample data instead.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
-from typing import List
+from typing import List, NamedTuple, Optional, Sequence
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
 
-from .config import HTTP_TIMEOUT, OFFLINE, USER_AGENT
+from . import http_cache
+from .config import HTTP_CACHE, HTTP_TIMEOUT, OFFLINE, USER_AGENT
 from .models import Institution
 
 
 HEADERS = {"User-Agent": USER_AGENT}
 
+# Per-refresh concurrency cap across roster/page fetches; keeps the crawl
+# gentle while overlapping the per-host RTTs.
+MAX_CONCURRENT_ROSTER_FETCHES = 8
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+class PersonRec(NamedTuple):
+    """One roster entry. A NamedTuple keeps tens of thousands of records per
+    refresh cheap to allocate and hashable for free in dedupe."""
+
+    name: str
+    email: Optional[str] = None
+    profile_url: Optional[str] = None
+    biography: Optional[str] = None
+
+
+# Repeated strings (Rush specialty blurbs, duplicate cards across pagination
+# waves, re-parsed pages) collapse to one shared object apiece, trimming
+# peak RSS during ingest and speeding dedupe's tuple hashing.
+_INTERN: dict = {}
+_INTERN_MAX = 10_000
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return value
+    if len(_INTERN) >= _INTERN_MAX:
+        _INTERN.clear()
+    return _INTERN.setdefault(value, value)
+
+
+def _person(
+    name: str,
+    email: Optional[str] = None,
+    profile_url: Optional[str] = None,
+    biography: Optional[str] = None,
+) -> PersonRec:
+    return PersonRec(
+        _intern(name), _intern(email), _intern(profile_url), _intern(biography)
+    )
+
+# The BeautifulSoup fallback only ever reads anchors, so restrict parsing to
+# them: combined with the lxml parser this skips building the rest of the
+# tree entirely. Built once at import.
+_ANCHOR_STRAINER = SoupStrainer("a", href=True)
+
+# Compiled once at import; these run per card or per anchor across thousands
+# of roster entries per refresh.
+_RE_NEXT = re.compile("next", re.I)
+_RE_MD_DO = re.compile(r"\b(md|do)\b", re.I)
+_RE_FACULTY_PATH = re.compile(r"/(faculty|people|profile)")
+
+_CREDENTIALS = (
+    "md",
+    "do",
+    "phd",
+    "ms",
+    "mph",
+    "msn",
+    "mscr",
+    "mba",
+    "aud",
+    "pa",
+    "pa-c",
+    "aprn",
+    "np",
+    "fnp",
+    "anp",
+    "cnp",
+    "acnp",
+    "agnp",
+    "rn",
+    "bsn",
+    "facs",
+    "ccc-slp",
+    "faap",
+    "cnm",
+    "dnp",
+)
+# One or more trailing credentials (", MD, MSN", " PhD") stripped in a
+# single pass; the repeated group replaces the old strip-and-rescan loop.
+_RE_CREDENTIALS = re.compile(
+    r"(?:(?:,\s*|\s+)(?:" + "|".join(_CREDENTIALS) + r")\.?)+$", re.I
+)
+
 
 def _log(msg: str) -> None:
     """Lightweight console logging for scraper progress."""
@@ -30,45 +120,36 @@ def _log(msg: str) -> None:
 def _strip_credentials(raw_name: str) -> str:
     """Remove common degree suffixes and credentials from display names."""
 
-    credentials = [
-        "md",
-        "do",
-        "phd",
-        "ms",
-        "mph",
-        "msn",
-        "mscr",
-        "mba",
-        "aud",
-        "pa",
-        "pa-c",
-        "aprn",
-        "np",
-        "fnp",
-        "anp",
-        "cnp",
-        "acnp",
-        "agnp",
-        "rn",
-        "bsn",
-        "facs",
-        "ccc-slp",
-        "faap",
-        "cnm",
-        "dnp",
-    ]
-    pattern = r"(,\s*|\s+)(?:" + "|".join(credentials) + r")\.?$"
-    name = raw_name
-    # Drop repeated trailing credentials like ", MSN, PA-C".
-    while True:
-        new_name = re.sub(pattern, "", name, flags=re.I)
-        if new_name == name:
-            break
-        name = new_name
-    return name.strip()
+    return _RE_CREDENTIALS.sub("", raw_name).strip()
+
+
+def _build_tree(html: bytes | str) -> Optional[LexborHTMLParser]:
+    """
+    Parse HTML with lexbor (C parser, ~10x faster than html.parser). Returns
+    None if lexbor rejects the markup so callers can fall back to the more
+    forgiving BeautifulSoup path.
+    """
+    try:
+        return LexborHTMLParser(html)
+    except Exception:
+        return None
+
 
+def fetch_institution_roster(institution: Institution) -> List[PersonRec]:
+    """Sync wrapper for callers without an event loop (CLI, worker threads)."""
 
-def fetch_institution_roster(institution: Institution) -> List[dict]:
+    async def _run() -> List[PersonRec]:
+        async with httpx.AsyncClient(
+            headers=HEADERS, timeout=HTTP_TIMEOUT, limits=_LIMITS, http2=True
+        ) as client:
+            return await fetch_institution_roster_async(institution, client)
+
+    return asyncio.run(_run())
+
+
+async def fetch_institution_roster_async(
+    institution: Institution, client: httpx.AsyncClient
+) -> List[PersonRec]:
     if OFFLINE:
         _log(f"[scraper] ENT_OFFLINE set; skipping scrape for {institution.name}.")
         return []
@@ -79,115 +160,254 @@ def fetch_institution_roster(institution: Institution) -> List[dict]:
     _log(f"[scraper] Fetching roster for {institution.name} ({url})")
     if "northwestern" in url:
         _log("[scraper] Using Northwestern scraper.")
-        return fetch_northwestern(url)
+        return await fetch_northwestern(client, url)
 
-    html = fetch_html(url)
+    html = await fetch_html_async(client, url)
     if not html:
         _log(f"[scraper] Unable to fetch HTML for {url}; returning empty roster.")
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    return _parse_roster_html(html, url)
+
+
+async def gather_all(
+    institutions: Sequence[Institution], client: Optional[httpx.AsyncClient] = None
+) -> List[List[PersonRec]]:
+    """
+    Fetch every institution's roster concurrently over one client, bounded
+    by a semaphore. Returns one roster per institution, in order; failures
+    yield empty rosters.
+    """
+    if client is None:
+        async with httpx.AsyncClient(
+            headers=HEADERS, timeout=HTTP_TIMEOUT, limits=_LIMITS, http2=True
+        ) as owned:
+            return await gather_all(institutions, owned)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ROSTER_FETCHES)
+
+    async def one(institution: Institution) -> List[PersonRec]:
+        async with semaphore:
+            return await fetch_institution_roster_async(institution, client)
+
+    results = await asyncio.gather(
+        *(one(inst) for inst in institutions), return_exceptions=True
+    )
+    return [r if isinstance(r, list) else [] for r in results]
+
+
+# Parse output memoized on (content hash, url): identical bodies — common
+# with the HTTP cache enabled or when a refresh re-reads a page — skip tree
+# construction entirely. blake2b is the cheapest keyed hash in hashlib.
+_PARSE_CACHE: dict = {}
+_PARSE_CACHE_MAX = 32
+
+
+def _parse_roster_html(html: bytes, url: str) -> List[PersonRec]:
+    key = (hashlib.blake2b(html, digest_size=16).digest(), url)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+    records = _parse_roster_tree(html, url)
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[key] = records
+    return list(records)
+
+
+def _parse_roster_tree(html: bytes, url: str) -> List[PersonRec]:
+    tree = _build_tree(html)
+    if tree is None:
+        _log(f"[scraper] lexbor failed for {url}; using BeautifulSoup fallback.")
+        return _bs4_generic_scrape(html, url)
 
     if "uchicago" in url:
         _log("[scraper] Using UChicago scraper.")
-        return parse_uchicago(soup, url)
+        return parse_uchicago(tree, url)
     if "uic.edu" in url:
         _log("[scraper] Using UIC scraper.")
-        return parse_uic(soup, url)
+        return parse_uic(tree, url)
     if "rush.edu" in url:
         _log("[scraper] Using Rush scraper.")
-        return parse_rush(soup, url)
+        return parse_rush(tree, url)
 
     _log("[scraper] Using generic scraper.")
-    return generic_people_scrape(soup, url)
+    return generic_people_scrape(tree, url)
 
 
-def fetch_html(url: str) -> str | None:
+def fetch_html(url: str, client: Optional[httpx.Client] = None) -> bytes | None:
+    # Bodies stay bytes end to end: lexbor parses them directly, so skipping
+    # the .text decode avoids holding a second full-page copy in memory.
+    # Pass a client to reuse its connection pool across same-host fetches;
+    # without one, a throwaway client pays the handshake per call.
     _log(f"[scraper] GET {url}")
+    if client is None:
+        with httpx.Client(
+            headers=HEADERS, timeout=HTTP_TIMEOUT, http2=True
+        ) as owned:
+            return fetch_html(url, owned)
+    cached, cond_headers = http_cache.load(url) if HTTP_CACHE else (None, {})
     try:
-        with httpx.Client(headers=HEADERS, timeout=HTTP_TIMEOUT) as client:
-            resp = client.get(url)
+        resp = client.get(url, headers=cond_headers)
+        if resp.status_code == 304 and cached is not None:
+            _log(f"[scraper] 304 for {url}; serving cached body.")
+            return cached
+        resp.raise_for_status()
+        if HTTP_CACHE:
+            http_cache.store(url, resp.content, resp.headers)
+        return resp.content
+    except Exception:
+        _log(f"[scraper] Request failed for {url}")
+        return None
+
+
+async def fetch_html_async(client: httpx.AsyncClient, url: str) -> bytes | None:
+    _log(f"[scraper] GET {url}")
+    cached, cond_headers = http_cache.load(url) if HTTP_CACHE else (None, {})
+    try:
+        async with client.stream("GET", url, headers=cond_headers) as resp:
+            if resp.status_code == 304 and cached is not None:
+                _log(f"[scraper] 304 for {url}; serving cached body.")
+                return cached
             resp.raise_for_status()
-            return resp.text
+            body = await resp.aread()
+        if HTTP_CACHE:
+            http_cache.store(url, body, resp.headers)
+        return body
     except Exception:
         _log(f"[scraper] Request failed for {url}")
         return None
 
 
-def fetch_northwestern(base_url: str) -> List[dict]:
+async def fetch_northwestern(client: httpx.AsyncClient, base_url: str) -> List[PersonRec]:
     """
     Northwestern faculty pages are paginated (9 pages). Each page has:
     - div.facultyList
       - multiple div.profile.row
         - h3 > a (name + profile link)
         - p.rankDept with title info
+
+    Page one is fetched first to discover the pagination links; the
+    remaining pages then download concurrently instead of one next-link hop
+    per round trip.
     """
-    results: List[dict] = []
-    seen_pages = set()
-    next_url = base_url
-
-    while next_url and next_url not in seen_pages:
-        _log(f"[scraper] Parsing Northwestern page: {next_url}")
-        seen_pages.add(next_url)
-        html = fetch_html(next_url)
-        if not html:
-            break
-        soup = BeautifulSoup(html, "html.parser")
-        results.extend(parse_northwestern_page(soup, base_url))
-        next_url = find_next_page(soup, next_url)
+    _log(f"[scraper] Parsing Northwestern page: {base_url}")
+    html = await fetch_html_async(client, base_url)
+    if not html:
+        return []
+    tree = _build_tree(html)
+    if tree is None:
+        return dedupe(_bs4_generic_scrape(html, base_url))
+
+    results: List[PersonRec] = []
+    results.extend(parse_northwestern_page(tree, base_url))
+
+    seen_pages = {base_url}
+    pending = [u for u in _discover_page_urls(tree, base_url) if u not in seen_pages]
+    semaphore = asyncio.BoundedSemaphore(4)
+
+    async def fetch_one(url: str) -> bytes | None:
+        async with semaphore:
+            return await fetch_html_async(client, url)
+
+    while pending:
+        seen_pages.update(pending)
+        pages = await asyncio.gather(
+            *(fetch_one(u) for u in pending), return_exceptions=True
+        )
+        next_pending: List[str] = []
+        for page_url, page_html in zip(pending, pages):
+            if not isinstance(page_html, bytes) or not page_html:
+                continue
+            page_tree = _build_tree(page_html)
+            if page_tree is None:
+                results.extend(_bs4_generic_scrape(page_html, base_url))
+                continue
+            _log(f"[scraper] Parsing Northwestern page: {page_url}")
+            results.extend(parse_northwestern_page(page_tree, base_url))
+            for url in _discover_page_urls(page_tree, page_url):
+                if url not in seen_pages:
+                    seen_pages.add(url)
+                    next_pending.append(url)
+        pending = next_pending
 
     return dedupe(results)
 
 
-def parse_northwestern_page(soup: BeautifulSoup, base_url: str) -> List[dict]:
+def _discover_page_urls(tree: LexborHTMLParser, current_url: str) -> List[str]:
+    """All pagination targets on a page, resolved and de-duplicated in order."""
+    urls: List[str] = []
+    for a in tree.css(".pagination a, .pager a, .pager-next a"):
+        href = a.attributes.get("href")
+        if href and not href.startswith(("mailto:", "tel:", "#")):
+            urls.append(urljoin(current_url, href))
+    next_url = find_next_page(tree, current_url)
+    if next_url:
+        urls.append(next_url)
+    return list(dict.fromkeys(urls))
+
+
+def parse_northwestern_page(tree: LexborHTMLParser, base_url: str) -> List[PersonRec]:
     results = []
-    cards = soup.select("#facultyList div.profile.row")
+    cards = tree.css("#facultyList div.profile.row")
     if not cards:
-        return generic_people_scrape(soup, base_url)
-
+        return generic_people_scrape(tree, base_url)
+
+    # Two css_first lookups per card, both inside lexbor's C engine, with
+    # mailto:/tel: ruled out in the selector instead of re-checked per
+    # anchor in Python. Kept separate so the h3 anchor stays preferred: a
+    # combined group would return whichever match comes first in document
+    # order, e.g. a linked photo above the heading.
+    h3_link_selector = "h3 a[href]:not([href^='mailto:']):not([href^='tel:'])"
+    profile_link_selector = (
+        "a[href*='profile']:not([href^='mailto:']):not([href^='tel:'])"
+    )
     for card in cards:
-        h3 = card.find("h3")
-        link = h3.find("a") if h3 else None
-
-        # Prefer profile links (profile.html?...), avoid mailto/tel anchors.
-        if not link or not link.get("href"):
-            link = card.find("a", href=re.compile(r"profile", re.I))
-        if link and link.get("href", "").startswith(("mailto:", "tel:")):
-            link = None
-
-        name = link.get_text(strip=True) if link else (h3.get_text(strip=True) if h3 else None)
-        profile_url = urljoin(base_url, link["href"]) if link and link.get("href") else None
+        link = card.css_first(h3_link_selector) or card.css_first(
+            profile_link_selector
+        )
+        name = link.text(strip=True) if link is not None else None
+        if not name:
+            # Image-only anchors have no text; the heading still names them.
+            h3 = card.css_first("h3")
+            name = h3.text(strip=True) if h3 else None
+        href = link.attributes.get("href") if link is not None else None
+        profile_url = urljoin(base_url, href) if href else None
         email = None  # NW page does not expose email on the list; leave null.
 
         if name:
-            results.append(
-                {
-                    "name": name,
-                    "email": email,
-                    "profile_url": profile_url,
-                }
-            )
+            results.append(_person(name=name, email=email, profile_url=profile_url))
     return results
 
 
-def find_next_page(soup: BeautifulSoup, current_url: str) -> str | None:
+def find_next_page(tree: LexborHTMLParser, current_url: str) -> str | None:
     # Look for pagination links labeled next or with rel/aria markers.
-    next_link = soup.find("a", attrs={"aria-label": re.compile("next", re.I)})
-    if not next_link:
-        next_link = soup.find("a", string=re.compile("next", re.I))
-    if not next_link:
-        next_link = soup.select_one(".pagination a.next, .pager-next a")
-    if next_link and next_link.get("href"):
-        return urljoin(current_url, next_link["href"])
+    next_link = None
+    anchors = tree.css("a")
+    for a in anchors:
+        if _RE_NEXT.search(a.attributes.get("aria-label") or ""):
+            next_link = a
+            break
+    if next_link is None:
+        for a in anchors:
+            if _RE_NEXT.search(a.text(strip=True)):
+                next_link = a
+                break
+    if next_link is None:
+        next_link = tree.css_first(".pagination a.next, .pager-next a")
+    if next_link is not None:
+        href = next_link.attributes.get("href")
+        if href:
+            return urljoin(current_url, href)
     return None
 
 
-def parse_uchicago(soup: BeautifulSoup, base_url: str) -> List[dict]:
-    sections = soup.find_all("section", class_="container")
+def parse_uchicago(tree: LexborHTMLParser, base_url: str) -> List[PersonRec]:
+    sections = tree.css("section.container")
     start_idx = None
     end_idx = None
     for idx, sec in enumerate(sections):
-        heading = sec.find(["h1", "h2", "h3"])
-        title = heading.get_text(strip=True) if heading else ""
+        heading = sec.css_first("h1, h2, h3")
+        title = heading.text(strip=True) if heading else ""
         if start_idx is None and title == "Our Ear and Hearing Team":
             start_idx = idx
         if title == "Our Voice Center Team":
@@ -195,145 +415,197 @@ def parse_uchicago(soup: BeautifulSoup, base_url: str) -> List[dict]:
             break
 
     if start_idx is None:
-        return generic_people_scrape(soup, base_url)
+        return generic_people_scrape(tree, base_url)
     target_sections = sections[start_idx : end_idx if end_idx is not None else len(sections)]
 
-    results: List[dict] = []
+    results: List[PersonRec] = []
     for sec in target_sections:
-        links = sec.select("a.Profile_profile__f6TYC, a[href*='/find-a-physician/physician/']")
+        links = sec.css("a.Profile_profile__f6TYC, a[href*='/find-a-physician/physician/']")
         for link in links:
-            href = link.get("href")
+            href = link.attributes.get("href")
             if not href or href.startswith(("mailto:", "tel:")):
                 continue
-            name_el = link.find(["h3", "h4"])
-            name = name_el.get_text(" ", strip=True) if name_el else link.get_text(" ", strip=True)
+            name_el = link.css_first("h3, h4")
+            name = name_el.text(separator=" ", strip=True) if name_el else link.text(
+                separator=" ", strip=True
+            )
             if not name:
-                img = link.find("img")
-                alt = img.get("alt") if img else None
+                img = link.css_first("img")
+                alt = img.attributes.get("alt") if img else None
                 name = alt.strip() if alt else ""
             name = _strip_credentials(name)
             if not name:
                 continue
             profile_url = urljoin(base_url, href)
-            results.append({"name": name, "email": None, "profile_url": profile_url})
+            results.append(_person(name=name, profile_url=profile_url))
 
-    return dedupe(results) if results else generic_people_scrape(soup, base_url)
+    return dedupe(results) if results else generic_people_scrape(tree, base_url)
 
 
-def parse_uic(soup: BeautifulSoup, base_url: str) -> List[dict]:
+def parse_uic(tree: LexborHTMLParser, base_url: str) -> List[PersonRec]:
     results = []
     # New UIC layout: directory-list > profile-teaser cards
-    teaser_cards = soup.select(".directory-list.list--flat .profile-teaser")
+    teaser_cards = tree.css(".directory-list.list--flat .profile-teaser")
     if teaser_cards:
         for card in teaser_cards:
-            name_el = card.select_one("._name a, ._name")
-            name = name_el.get_text(" ", strip=True) if name_el else card.get_text(" ", strip=True)
-
-            email_el = card.find("a", href=re.compile(r"mailto:", re.I))
-            email = email_el.get("href", "").split("mailto:")[-1] if email_el else None
+            name_link = card.css_first("._name a")
+            name_el = name_link or card.css_first("._name")
+            name = (
+                name_el.text(separator=" ", strip=True)
+                if name_el
+                else card.text(separator=" ", strip=True)
+            )
 
-            link = card.select_one("._name a") or card.find(
-                "a", href=re.compile(r"profiles/", re.I)
+            email_el = card.css_first("a[href*='mailto:']")
+            email = (
+                (email_el.attributes.get("href") or "").split("mailto:")[-1]
+                if email_el
+                else None
             )
-            if not link:
-                link = card.find("a", href=True)
+
+            link = name_link or card.css_first("a[href*='profiles/']")
+            if link is None:
+                link = card.css_first("a[href]")
             profile_url = None
-            if link:
-                href = link.get("href")
+            if link is not None:
+                href = link.attributes.get("href")
                 if href and not href.startswith(("mailto:", "tel:")):
                     profile_url = urljoin(base_url, href)
 
             if name:
-                results.append({"name": name, "email": email, "profile_url": profile_url})
+                results.append(
+                    _person(name=name, email=email, profile_url=profile_url)
+                )
 
         return dedupe(results)
 
     # Fallback to older structures
-    cards = soup.select(".faculty-list .person, .profile-card")
+    cards = tree.css(".faculty-list .person, .profile-card")
+    prefix = base_url.rstrip("/") + "/"
     for card in cards:
-        name_el = card.select_one(".person-name, h3, h4")
-        name = name_el.get_text(strip=True) if name_el else card.get_text(" ", strip=True)
-        email_el = card.find("a", href=re.compile(r"mailto:"))
-        email = email_el.get("href", "").split("mailto:")[-1] if email_el else None
-        profile_link = card.find("a", href=True)
+        name_el = card.css_first(".person-name, h3, h4")
+        name = (
+            name_el.text(strip=True) if name_el else card.text(separator=" ", strip=True)
+        )
+        email_el = card.css_first("a[href*='mailto:']")
+        email = (
+            (email_el.attributes.get("href") or "").split("mailto:")[-1]
+            if email_el
+            else None
+        )
+        profile_link = card.css_first("a[href]")
         profile_url = None
-        if profile_link:
-            href = profile_link.get("href")
+        if profile_link is not None:
+            href = profile_link.attributes.get("href")
             if href and not href.startswith("mailto:"):
-                profile_url = href if href.startswith("http") else base_url.rstrip("/") + "/" + href.lstrip("/")
+                profile_url = href if href.startswith("http") else prefix + href.lstrip("/")
         if name:
-            results.append({"name": name, "email": email, "profile_url": profile_url})
+            results.append(_person(name=name, email=email, profile_url=profile_url))
     return dedupe(results)
 
 
-def parse_rush(soup: BeautifulSoup, base_url: str) -> List[dict]:
-    team_items = soup.select(".meet-the-team--item")
-    results: List[dict] = []
+def parse_rush(tree: LexborHTMLParser, base_url: str) -> List[PersonRec]:
+    team_items = tree.css(".meet-the-team--item")
+    results: List[PersonRec] = []
 
     if team_items:
         for item in team_items:
-            name_link = item.select_one("h3 a")
-            raw_name = name_link.get_text(" ", strip=True) if name_link else item.get_text(" ", strip=True)
+            name_link = item.css_first("h3 a")
+            raw_name = (
+                name_link.text(separator=" ", strip=True)
+                if name_link
+                else item.text(separator=" ", strip=True)
+            )
 
             # Skip providers without physician credentials (e.g., PA, NP).
-            if not re.search(r"\b(md|do)\b", raw_name, flags=re.I):
+            if not _RE_MD_DO.search(raw_name):
                 continue
 
             name = _strip_credentials(raw_name)
             if not name:
                 continue
 
-            profile_url = urljoin(base_url, name_link["href"]) if name_link and name_link.get("href") else None
-            specialty_el = item.select_one(".specialties")
-            specialty = specialty_el.get_text(" ", strip=True) if specialty_el else None
+            href = name_link.attributes.get("href") if name_link is not None else None
+            profile_url = urljoin(base_url, href) if href else None
+            specialty_el = item.css_first(".specialties")
+            specialty = (
+                specialty_el.text(separator=" ", strip=True) if specialty_el else None
+            )
 
             results.append(
-                {
-                    "name": name,
-                    "email": None,
-                    "profile_url": profile_url,
-                    "biography": specialty,
-                }
+                _person(name=name, profile_url=profile_url, biography=specialty)
             )
 
         return dedupe(results)
 
     results = []
-    cards = soup.select(".provider-card, .views-row, article, .card--provider")
+    cards = tree.css(".provider-card, .views-row, article, .card--provider")
 
     for card in cards:
-        name_el = card.select_one(
+        name_el = card.css_first(
             ".provider-card__name, .provider-name, .provider-card__title, h3, h2"
         )
-        link = card.find("a", href=True)
+        link = card.css_first("a[href]")
 
-        raw_name = ""
-        if name_el:
-            raw_name = name_el.get_text(" ", strip=True)
-        elif link:
-            raw_name = link.get_text(" ", strip=True)
+        if name_el is not None:
+            raw_name = name_el.text(separator=" ", strip=True)
+        elif link is not None:
+            raw_name = link.text(separator=" ", strip=True)
         else:
-            raw_name = card.get_text(" ", strip=True)
+            raw_name = card.text(separator=" ", strip=True)
 
         name = _strip_credentials(raw_name)
         if not name:
             continue
 
         profile_url = None
-        if link:
-            href = link.get("href")
+        if link is not None:
+            href = link.attributes.get("href")
             if href and not href.startswith("mailto:"):
                 profile_url = urljoin(base_url, href)
 
-        results.append({"name": name, "email": None, "profile_url": profile_url})
+        results.append(_person(name=name, profile_url=profile_url))
 
     if results:
         return dedupe(results)
-    return generic_people_scrape(soup, base_url)
+    return generic_people_scrape(tree, base_url)
 
 
-def generic_people_scrape(soup: BeautifulSoup, base_url: str) -> List[dict]:
+def generic_people_scrape(tree: LexborHTMLParser, base_url: str) -> List[PersonRec]:
     results = []
+    # The base never changes within one page, so build the join prefix once
+    # instead of rstrip-ing it per anchor.
+    prefix = base_url.rstrip("/") + "/"
+    for a in tree.css("a"):
+        href = a.attributes.get("href")
+        if not href:
+            continue
+        text = a.text(separator=" ", strip=True)
+        if not text:
+            continue
+        if "mailto:" in href:
+            email = href.split("mailto:")[-1]
+            results.append(_person(name=text, email=email))
+        elif _RE_FACULTY_PATH.search(href):
+            results.append(
+                _person(
+                    name=text,
+                    profile_url=href
+                    if href.startswith("http")
+                    else prefix + href.lstrip("/"),
+                )
+            )
+    return dedupe(results)
+
+
+def _bs4_generic_scrape(html: bytes, base_url: str) -> List[PersonRec]:
+    """
+    Last-resort scrape for markup lexbor cannot parse; mirrors
+    generic_people_scrape on top of BeautifulSoup's forgiving parser.
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_ANCHOR_STRAINER)
+    results = []
+    prefix = base_url.rstrip("/") + "/"
     for a in soup.find_all("a", href=True):
         text = a.get_text(" ", strip=True)
         href = a["href"]
@@ -341,25 +613,20 @@ def generic_people_scrape(soup: BeautifulSoup, base_url: str) -> List[dict]:
             continue
         if "mailto:" in href:
             email = href.split("mailto:")[-1]
-            results.append({"name": text, "email": email, "profile_url": None})
-        elif re.search(r"/(faculty|people|profile)", href):
+            results.append(_person(name=text, email=email))
+        elif _RE_FACULTY_PATH.search(href):
             results.append(
-                {
-                    "name": text,
-                    "email": None,
-                    "profile_url": href if href.startswith("http") else base_url.rstrip("/") + "/" + href.lstrip("/"),
-                }
+                _person(
+                    name=text,
+                    profile_url=href
+                    if href.startswith("http")
+                    else prefix + href.lstrip("/"),
+                )
             )
     return dedupe(results)
 
 
-def dedupe(records: List[dict]) -> List[dict]:
-    seen = set()
-    unique = []
-    for r in records:
-        key = (r.get("name"), r.get("email"), r.get("profile_url"))
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(r)
-    return unique
+def dedupe(records: List[PersonRec]) -> List[PersonRec]:
+    # PersonRec hashes as a plain tuple, so dict.fromkeys de-duplicates in
+    # one C-level pass while preserving insertion order.
+    return list(dict.fromkeys(records))
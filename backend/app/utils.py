@@ -1,22 +1,52 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import json
+import re
 from typing import Iterable
 
+# Fast path for the ISO-ish dates OpenAlex and the seeds emit; a trailing
+# time component is tolerated and ignored.
+_DATE_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?(?:T.*)?")
 
+
+def decode_co_authors(value: str | None) -> list[str]:
+    """Decode a stored co-author list: JSON now, comma-joined historically."""
+
+    if not value:
+        return []
+    if value.startswith("["):
+        try:
+            return [str(name) for name in json.loads(value)]
+        except ValueError:
+            pass
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_pub_date(value: str | None) -> dt.date | None:
     """Best-effort parser for publication dates."""
 
     if not value:
         return None
     value = value.strip()
-    formats = ("%Y-%m-%d", "%Y-%m", "%Y")
-    for fmt in formats:
+    match = _DATE_RE.fullmatch(value)
+    if match:
+        try:
+            return dt.date(
+                int(match.group(1)),
+                int(match.group(2) or 1),
+                int(match.group(3) or 1),
+            )
+        except ValueError:
+            return None
+    # Odd shapes (unpadded months, etc.) take the slow strptime road.
+    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
         try:
             return dt.datetime.strptime(value, fmt).date()
         except ValueError:
             continue
-    # Fallback: try splitting on "T" and parse date portion.
     if "T" in value:
         return parse_pub_date(value.split("T", 1)[0])
     return None